@@ -1,8 +1,8 @@
 import os
 import random
+from functools import partial
 from os import path as osp
 
-import cv2
 import gym
 import numpy as np
 from gym import spaces
@@ -24,9 +24,7 @@ class PlaygroundEnv(gym.Env):
         continuous_action_space = config.get('continuous_action_space', True)
         multisteps = config.get('multisteps')
 
-        seed = (seed + id(self)) % (2**32)
-        random.seed(seed)
-        np.random.seed(seed)
+        self.seed((seed + id(self)) % (2**32))
 
         self.video_dir = config.get('video_dir')
 
@@ -45,37 +43,49 @@ class PlaygroundEnv(gym.Env):
             assert isinstance(multisteps, int)
             self.multisteps = multisteps
 
+        # Resolve the engine call once rather than branching every step.
+        if self.multisteps is None:
+            self._engine_step = self.game.step
+        else:
+            self._engine_step = partial(self.game.multiple_steps,
+                                        n_steps=self.multisteps)
+
     def _set_obs_space(self):
         d = {}
+        sensor_plan = []
         for sensor in self.agent.sensors:
             if isinstance(sensor.shape, int):
                 shape = (sensor.shape, 1)
             else:
-                shape = sensor.shape
+                shape = tuple(sensor.shape)
 
             d[sensor.name] = spaces.Box(low=0,
                                         high=1,
                                         shape=shape,
                                         dtype=np.float32)
+            sensor_plan.append((sensor.name, sensor, shape))
 
         self.observation_space = spaces.Dict(d)
+        self._sensor_plan = tuple(sensor_plan)
 
     def _set_action_space(self, continuous_action_space):
-        actuators = self.agent.controller.controlled_actuators
+        actuators = tuple(self.agent.controller.controlled_actuators)
+        self._apply_actions = tuple(actuator.apply_action
+                                    for actuator in actuators)
         self.continuous_action_space = continuous_action_space
 
         if self.continuous_action_space:
-            lows = []
-            highs = []
-
-            for actuator in actuators:
-
-                lows.append(actuator.min)
-                highs.append(actuator.max)
-
-            self.action_space = spaces.Box(
-                low=np.array(lows).astype(np.float32),
-                high=np.array(highs).astype(np.float32))
+            n_actuators = len(actuators)
+            lows = np.fromiter((actuator.min for actuator in actuators),
+                               dtype=np.float32,
+                               count=n_actuators)
+            highs = np.fromiter((actuator.max for actuator in actuators),
+                                dtype=np.float32,
+                                count=n_actuators)
+
+            self.action_space = spaces.Box(low=lows,
+                                           high=highs,
+                                           dtype=np.float32)
 
         else:
             # TODO:
@@ -132,6 +142,12 @@ class PlaygroundEnv(gym.Env):
         self.agent = agent
         assert self.agent in self.game.agents
 
+        # Actions are applied to the actuators directly, so the entry for
+        # our own agent stays empty and the dict can be reused every step.
+        self._actions_to_game_engine = {self.agent: {}}
+        self._other_agents = tuple(a for a in self.game.agents
+                                   if a is not self.agent)
+
     @property
     def engine(self):
         return self.game
@@ -139,40 +155,45 @@ class PlaygroundEnv(gym.Env):
     def get_current_timestep(self):
         return self.game.elapsed_time
 
-    def step(self, actions):
-        actions_to_game_engine = {}
-        actions_dict = {}
+    def seed(self, seed=None):
+        # Playgrounds draw from the global generators, so seed those.
+        random.seed(seed)
+        np.random.seed(seed)
+        return [seed]
 
-        actuators = self.agent.controller.controlled_actuators
-        for actuator, action in zip(actuators, actions):
-            actuator.apply_action(action)
+    def step(self, actions):
+        actions_to_game_engine = self._actions_to_game_engine
 
-        actions_to_game_engine[self.agent] = actions_dict
+        # One C-level conversion instead of unboxing numpy scalars per actuator
+        actions = np.asarray(actions, dtype=np.float64).tolist()
+        for apply_action, action in zip(self._apply_actions, actions):
+            apply_action(action)
 
         # Generate actions for other agents
-        for agent in self.game.agents:
-            if agent is not self.agent:
-                actions_to_game_engine[agent] = \
-                    agent.controller.generate_actions()
+        for agent in self._other_agents:
+            actions_to_game_engine[agent] = agent.controller.generate_actions()
 
-        if self.multisteps is None:
-            self.game.step(actions_to_game_engine)
-        else:
-            self.game.multiple_steps(actions_to_game_engine,
-                                     n_steps=self.multisteps)
+        self._engine_step(actions_to_game_engine)
         self.game.update_observations()
 
-        reward = self.agent.reward
         done = self.playground.done or not self.game.game_on
 
-        return (self.observations, reward, done, {})
+        # A fresh info dict each step: RLlib keeps per-step infos in its
+        # sample batches, so a shared instance would alias across steps.
+        return self.observations, self.agent.reward, done, {}
 
     @property
     def observations(self):
-        sensor_values = {}
-        for sensor in self.agent.sensors:
-            sensor_values[sensor.name] = sensor.sensor_values
-        return sensor_values
+        # observation_space is float32; the conversion is a no-op when the
+        # sensor already produces a C-contiguous float32 array, and a single
+        # copy otherwise, which keeps serialisation to other workers on the
+        # fast buffer path. The shape resolved in _set_obs_space is applied
+        # as a view, without re-inspecting sensor.shape.
+        return {
+            name: np.ascontiguousarray(sensor.sensor_values,
+                                       dtype=np.float32).reshape(shape)
+            for name, sensor, shape in self._sensor_plan
+        }
 
     def reset(self):
         self.game.reset()
@@ -186,6 +207,9 @@ class PlaygroundEnv(gym.Env):
         if self.video_dir is None:
             return None
 
+        # Only needed when recording; keeps worker start-up light.
+        import cv2
+
         img = self.game.generate_agent_image(self.agent)
         img = (255 * img).astype(np.uint8)
 
@@ -202,50 +226,25 @@ class PlaygroundEnv(gym.Env):
         self.game.terminate()
 
 
+_CAMERA_PARAMS = {'fov': 180, 'range': 300, 'resolution': 64}
+_TOUCH_PARAMS = {'range': 2, 'resolution': 64}
+
+SENSOR_CONFIGS = {
+    'rgb': (('rgb', _CAMERA_PARAMS), ),
+    'depth': (('depth', _CAMERA_PARAMS), ),
+    'rgb_depth': (('depth', _CAMERA_PARAMS), ('rgb', _CAMERA_PARAMS)),
+    'rgb_touch': (('rgb', _CAMERA_PARAMS), ('touch', _TOUCH_PARAMS)),
+    'rgb_depth_touch': (('depth', _CAMERA_PARAMS), ('rgb', _CAMERA_PARAMS),
+                        ('touch', _TOUCH_PARAMS)),
+    'blind': (('blind', {
+        'resolution': 64
+    }), ),
+}
+
+
 def get_sensor_params(sensors_name):
-    if sensors_name == 'rgb':
-        sensors = [('rgb', {'fov': 180, 'range': 300, 'resolution': 64})]
-
-    elif sensors_name == 'depth':
-        sensors = [('depth', {'fov': 180, 'range': 300, 'resolution': 64})]
-
-    elif sensors_name == 'rgb_depth':
-        sensors = [('depth', {
-            'fov': 180,
-            'range': 300,
-            'resolution': 64
-        }), ('rgb', {
-            'fov': 180,
-            'range': 300,
-            'resolution': 64
-        })]
-
-    elif sensors_name == 'rgb_touch':
-        sensors = [('rgb', {
-            'fov': 180,
-            'range': 300,
-            'resolution': 64
-        }), ('touch', {
-            'range': 2,
-            'resolution': 64
-        })]
-
-    elif sensors_name == 'rgb_depth_touch':
-        sensors = [('depth', {
-            'fov': 180,
-            'range': 300,
-            'resolution': 64
-        }), ('rgb', {
-            'fov': 180,
-            'range': 300,
-            'resolution': 64
-        }), ('touch', {
-            'range': 2,
-            'resolution': 64
-        })]
-    elif sensors_name == 'blind':
-        sensors = [('blind', {'resolution': 64})]
-    else:
+    if sensors_name not in SENSOR_CONFIGS:
         raise ValueError(f"Wrong sensors_name: {sensors_name}")
 
-    return sensors
+    return [(name, dict(params))
+            for name, params in SENSOR_CONFIGS[sensors_name]]